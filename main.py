@@ -7,18 +7,31 @@ and posts to Slack daily at 9 AM KST.
 
 import os
 import sys
-import base64
+import asyncio
+import codecs
+import hashlib
+import json
 import re
 import time
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-import pytz
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from typing import List, Dict, Optional, Tuple
+from urllib.parse import urlsplit
+from zoneinfo import ZoneInfo
+import aiohttp
+import orjson
+import diskcache
 from telethon import TelegramClient
-from telethon.tl.types import Message
-import google.generativeai as genai
-import requests
-from bs4 import BeautifulSoup
+from telethon.errors import ChannelPrivateError, ChannelInvalidError
+from telethon.tl.types import Message, InputPeerChannel
+from selectolax.lexbor import LexborHTMLParser
 from dotenv import load_dotenv
+from session_utils import load_session, resolve_channel, forget_channel
+
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
 
 # Load environment variables
 load_dotenv()
@@ -26,6 +39,8 @@ load_dotenv()
 # Configuration
 TELEGRAM_API_ID = os.getenv('TELEGRAM_API_ID')
 TELEGRAM_API_HASH = os.getenv('TELEGRAM_API_HASH')
+# Daily window and timestamps are in Korea Standard Time
+KST = ZoneInfo('Asia/Seoul')
 # Support multiple channels
 TELEGRAM_CHANNELS = {
     'ahboyashreads': 'scrape',  # Scrape article content
@@ -34,6 +49,43 @@ TELEGRAM_CHANNELS = {
 GEMINI_API_KEY = os.getenv('GEMINI_API_KEY')
 SLACK_WEBHOOK_URL = os.getenv('SLACK_WEBHOOK_URL')
 TELEGRAM_SESSION_B64 = os.getenv('TELEGRAM_SESSION')
+# Scraped articles and Gemini output, so re-runs (e.g. after a quota error) skip the network
+CACHE = diskcache.Cache('.scrape_cache', size_limit=100 * 1024 * 1024)
+CACHE_EXPIRE = 7 * 86400
+
+# Gemini free tier limits (15 RPM, 1M TPM, 250 RPD) with a 20% safety margin.
+# The daily count is kept in CACHE, so re-runs and both workflows share the RPD budget
+GEMINI_WORKERS = 3
+GEMINI_RPM = 12
+GEMINI_TPM = 800_000
+GEMINI_RPD = 200
+GEMINI_MAX_INPUT_TOKENS = 2000
+GEMINI_TIMEOUT = aiohttp.ClientTimeout(total=30)
+GEMINI_API_BASE = 'https://generativelanguage.googleapis.com/v1beta'
+GEMINI_GENERATE_URL = f"{GEMINI_API_BASE}/models/gemini-2.5-flash:generateContent"
+
+SLACK_TIMEOUT = aiohttp.ClientTimeout(total=30)
+SLACK_HEADERS = {'Content-Type': 'application/json'}
+# Shared by reference across every message; never mutated
+DIVIDER_BLOCK = {"type": "divider"}
+
+# Gemini Batch Mode (50% cheaper, no per-request rate limit, results may take longer)
+GEMINI_BATCH_MODE = os.getenv('GEMINI_BATCH_MODE', '').lower() in ('1', 'true', 'yes')
+GEMINI_BATCH_TIMEOUT = int(os.getenv('GEMINI_BATCH_TIMEOUT') or '10800')  # GitHub Actions jobs cap at 6h
+GEMINI_BATCH_URL = f"{GEMINI_API_BASE}/models/gemini-2.5-flash:batchGenerateContent"
+BATCH_POLL_INTERVAL = 30
+BATCH_TERMINAL_STATES = {'BATCH_STATE_SUCCEEDED', 'BATCH_STATE_FAILED', 'BATCH_STATE_CANCELLED', 'BATCH_STATE_EXPIRED'}
+
+# Fixed instructions sent as systemInstruction. Keeping them identical and ahead of the
+# per-message text lets Gemini's implicit prefix caching bill repeated tokens at the cached rate.
+# (Explicit cachedContents needs >= 1024 tokens on Flash; these are ~150.)
+TRANSLATION_INSTRUCTION = """다음 영문 텍스트를 자연스러운 한국어로 번역해주세요.
+암호화폐/크립토 산업 용어는 원문 그대로 유지하면서 번역해주세요."""
+SUMMARY_INSTRUCTION = """다음은 암호화폐/크립토 산업 관련 뉴스입니다. 
+이 내용을 한국어로 정확히 3줄로 요약해주세요. 
+각 줄은 한 문장으로, 핵심 정보만 간결하게 담아주세요.
+각 줄 앞에 1️⃣ 2️⃣ 3️⃣ 이모티콘을 붙여주세요.
+(예시: 1️⃣ 첫번째 요약...\n2️⃣ 두번째 요약...\n3️⃣ 세번째 요약...)"""
 
 # Validate required environment variables
 def validate_config():
@@ -53,62 +105,53 @@ def validate_config():
     print("✅ All required environment variables are set")
 
 
-def setup_session_file():
-    """Setup Telegram session file from base64 encoded environment variable."""
-    if TELEGRAM_SESSION_B64:
-        try:
-            session_data = base64.b64decode(TELEGRAM_SESSION_B64)
-            with open('tg_session.session', 'wb') as f:
-                f.write(session_data)
-            print("✅ Telegram session file created from environment variable")
-            return 'tg_session'
-        except Exception as e:
-            print(f"⚠️  Failed to decode session from environment: {e}")
-            return 'tg_session'
-    else:
-        print("ℹ️  No session environment variable found, will create new session")
-        return 'tg_session'
+def yesterday_window() -> Tuple[datetime, datetime, str]:
+    """
+    Compute yesterday's date range in KST.
+    
+    Returns:
+        (yesterday's midnight, today's midnight, display date for Slack)
+    """
+    today_start = datetime.now(KST).replace(hour=0, minute=0, second=0, microsecond=0)
+    yesterday_start = today_start - timedelta(days=1)
+    return yesterday_start, today_start, yesterday_start.strftime('%Y년 %m월 %d일')
 
 
-async def fetch_yesterday_messages(client: TelegramClient, channel: str) -> List[Dict]:
+async def fetch_yesterday_messages(client: TelegramClient, channel: str,
+                                   window: Tuple[datetime, datetime, str]) -> List[Dict]:
     """
     Fetch messages from the specified Telegram channel from yesterday.
     
     Args:
         client: Authenticated Telegram client
         channel: Channel username or ID
+        window: Yesterday's range from yesterday_window()
         
     Returns:
         List of message dictionaries with text, date, and link
     """
-    # Calculate yesterday's date range in KST
-    kst = pytz.timezone('Asia/Seoul')
-    now_kst = datetime.now(kst)
-    yesterday_start = (now_kst - timedelta(days=1)).replace(hour=0, minute=0, second=0, microsecond=0)
-    yesterday_end = yesterday_start.replace(hour=23, minute=59, second=59)
+    yesterday_start, today_start, _ = window
+    # Telethon dates are aware UTC; comparing against the same tzinfo skips offset lookups
+    yesterday_start_utc = yesterday_start.astimezone(timezone.utc)
     
     print(f"📅 Fetching messages from {yesterday_start.strftime('%Y-%m-%d')} (KST)")
     
     messages = []
+    entity = None
     try:
         # Get the channel entity
-        entity = await client.get_entity(channel)
+        entity = await resolve_channel(client, channel)
         
-        # Fetch messages from yesterday (get last 100 messages and filter)
+        # Start right before today's midnight so Telegram only returns yesterday and older,
+        # newest first; no fixed limit, so busy days aren't cut off
         async for message in client.iter_messages(
             entity,
-            limit=100
+            offset_date=today_start
         ):
-            # Convert message date to KST
-            msg_date_kst = message.date.replace(tzinfo=pytz.UTC).astimezone(kst)
-            
-            # Check if message is from yesterday
-            if msg_date_kst < yesterday_start:
+            # Compare in UTC; convert only messages we keep
+            if message.date < yesterday_start_utc:
                 # Older than our target date, stop searching
                 break
-            if msg_date_kst > yesterday_end:
-                # Newer than our target date, skip
-                continue
             
             # Extract text from message
             text = message.message or ""
@@ -124,6 +167,9 @@ async def fetch_yesterday_messages(client: TelegramClient, channel: str) -> List
             # Generate message link
             msg_link = f"https://t.me/{channel}/{message.id}"
             
+            # Convert message date to KST
+            msg_date_kst = message.date.astimezone(KST)
+            
             messages.append({
                 'id': message.id,
                 'text': text,
@@ -134,11 +180,66 @@ async def fetch_yesterday_messages(client: TelegramClient, channel: str) -> List
         print(f"✅ Fetched {len(messages)} messages from yesterday")
         return messages
         
+    except (ChannelPrivateError, ChannelInvalidError) as e:
+        if isinstance(entity, InputPeerChannel):
+            # Cached access hash is no longer valid; resolve the username again
+            print("⚠️  Cached channel entity was rejected, resolving again")
+            await forget_channel(channel)
+            return await fetch_yesterday_messages(client, channel, window)
+        print(f"❌ Error fetching messages: {e}")
+        return []
+        
     except Exception as e:
         print(f"❌ Error fetching messages: {e}")
         return []
 
 
+SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
+}
+SCRAPE_TIMEOUT = aiohttp.ClientTimeout(total=10)
+URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+# Hosts that require JavaScript/login and can't be scraped
+BLOCKED_HOSTS = frozenset({
+    'x.com', 'www.x.com', 'mobile.x.com',
+    'twitter.com', 'www.twitter.com', 'mobile.twitter.com',
+    't.me'
+})
+PAYWALL_KEYWORDS = [
+    'sign up', 'subscribe', 'subscription', 'premium',
+    '유료', '구독', 'become a member', 'join now',
+    'create account', 'log in to read', 'members only'
+]
+PAYWALL_PATTERN = re.compile('|'.join(map(re.escape, PAYWALL_KEYWORDS)), re.IGNORECASE)
+# <meta charset="..."> or <meta http-equiv="Content-Type" content="...; charset=...">
+META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset\s*=\s*["\']?\s*([\w.:-]+)', re.IGNORECASE)
+META_CHARSET_SCAN_BYTES = 4096
+
+
+def sniff_charset(response: aiohttp.ClientResponse, body: bytes) -> str:
+    """
+    Pick a charset for pages whose Content-Type header doesn't declare one.
+    
+    aiohttp falls back to UTF-8 without looking at the body, which garbles
+    pages that only declare e.g. EUC-KR in a <meta> tag.
+    
+    Args:
+        response: Response being decoded
+        body: Raw response body
+        
+    Returns:
+        Charset from the page's <meta> tag, or 'utf-8'
+    """
+    match = META_CHARSET_PATTERN.search(body, 0, META_CHARSET_SCAN_BYTES)
+    if match:
+        charset = match.group(1).decode('ascii', 'ignore')
+        try:
+            return codecs.lookup(charset).name
+        except LookupError:
+            pass
+    return 'utf-8'
+
+
 def extract_urls(text: str) -> List[str]:
     """
     Extract URLs from text.
@@ -149,33 +250,31 @@ def extract_urls(text: str) -> List[str]:
     Returns:
         List of URLs found in text
     """
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    urls = re.findall(url_pattern, text)
-    return urls
+    return URL_PATTERN.findall(text)
 
 
-def fetch_article_content(url: str) -> Optional[str]:
+async def fetch_article_content(session: aiohttp.ClientSession, url: str) -> Optional[str]:
     """
     Fetch and extract main content from a URL.
     
     Args:
+        session: Shared aiohttp session for article scraping
         url: URL to fetch
         
     Returns:
         Extracted text content or None if failed
     """
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        response.raise_for_status()
+        async with session.get(url, timeout=SCRAPE_TIMEOUT) as response:
+            response.raise_for_status()
+            # Decode with the header or <meta> charset; lexbor assumes UTF-8 for raw bytes
+            html = await response.text(errors='replace')
         
-        soup = BeautifulSoup(response.content, 'lxml')
+        tree = LexborHTMLParser(html)
         
         # Remove script and style elements
-        for script in soup(["script", "style", "nav", "footer", "header"]):
-            script.decompose()
+        for node in tree.css('script, style, nav, footer, header'):
+            node.decompose()
         
         # Try to find main content
         content = None
@@ -191,37 +290,30 @@ def fetch_article_content(url: str) -> Optional[str]:
         ]
         
         for selector in article_selectors:
-            element = soup.select_one(selector)
+            element = tree.css_first(selector)
             if element:
-                content = element.get_text(separator='\n', strip=True)
+                content = element.text(separator='\n', strip=True)
                 break
         
         # Fallback to body
         if not content:
-            body = soup.find('body')
+            body = tree.body
             if body:
-                content = body.get_text(separator='\n', strip=True)
+                content = body.text(separator='\n', strip=True)
         
         if content:
             # Clean up excessive whitespace
-            lines = [line.strip() for line in content.split('\n') if line.strip()]
-            content = '\n'.join(lines)
+            # Strip each line once and drop blank ones (linear, unlike a \s*\n\s* regex)
+            content = '\n'.join(filter(None, map(str.strip, content.split('\n'))))
             
             # Check minimum length (300 chars)
             if len(content) < 300:
                 return None
             
             # Detect paywalls and subscription prompts
-            paywall_keywords = [
-                'sign up', 'subscribe', 'subscription', 'premium',
-                '유료', '구독', 'become a member', 'join now',
-                'create account', 'log in to read', 'members only'
-            ]
-            content_lower = content.lower()
-            if any(keyword in content_lower for keyword in paywall_keywords):
-                # Check if most of the content is paywall message
-                if len(content) < 1000:  # Short content with paywall = likely blocked
-                    return None
+            # Short content with paywall = likely blocked
+            if len(content) < 1000 and PAYWALL_PATTERN.search(content):
+                return None
             
             # Limit content length
             if len(content) > 5000:
@@ -235,45 +327,149 @@ def fetch_article_content(url: str) -> Optional[str]:
         return None
 
 
-def translate_to_korean(text: str, api_key: str) -> str:
+def chars_per_token(text: str) -> float:
     """
-    Translate English text to Korean using Google Gemini API.
+    Estimate the average characters per Gemini token for text.
+    
+    Latin text averages ~4 chars per token; CJK (including Korean) ~1.5.
+    """
+    if not text:
+        return 4.0
+    cjk_ratio = sum(1 for c in text if ord(c) > 0x2E80) / len(text)
+    return 4 * (1 - cjk_ratio) + 1.5 * cjk_ratio
+
+
+def estimate_tokens(text: str) -> int:
+    """Roughly estimate the Gemini token count of text."""
+    return int(len(text) / chars_per_token(text)) + 1
+
+
+def truncate_to_tokens(text: str, max_tokens: int = GEMINI_MAX_INPUT_TOKENS) -> str:
+    """
+    Truncate text to roughly a token budget instead of a fixed char count.
     
     Args:
-        text: Text to translate
-        api_key: Google Gemini API key
+        text: Text to truncate
+        max_tokens: Approximate maximum number of tokens to keep
         
     Returns:
-        Korean translation
+        Prefix of text that fits the budget
     """
-    try:
-        url = f"https://generativelanguage.googleapis.com/v1/models/gemini-2.5-flash:generateContent?key={api_key}"
-        
-        prompt = f"""다음 영문 텍스트를 자연스러운 한국어로 번역해주세요.
-암호화폐/크립토 산업 용어는 원문 그대로 유지하면서 번역해주세요.
+    return text[:int(max_tokens * chars_per_token(text))]
 
-영문:
-{text[:3000]}
 
-한국어 번역:"""
+def build_gemini_request(instruction: str, text: str) -> Dict:
+    """
+    Build a generateContent request body.
+    
+    Args:
+        instruction: Fixed system instruction shared by every request
+        text: Per-message text
         
-        payload = {
-            "contents": [{
-                "parts": [{
-                    "text": prompt
-                }]
+    Returns:
+        Request body usable for both interactive and batch calls
+    """
+    return {
+        "systemInstruction": {
+            "parts": [{
+                "text": instruction
             }]
-        }
+        },
+        "contents": [{
+            "parts": [{
+                "text": truncate_to_tokens(text)
+            }]
+        }]
+    }
+
+
+def trim_summary(summary: str) -> str:
+    """Keep at most the first 3 non-empty lines of a Gemini summary."""
+    lines = [line.strip() for line in summary.split('\n') if line.strip()]
+    return '\n'.join(lines[:3])
+
+
+class GeminiRateLimiter:
+    """
+    Sliding-window limiter for Gemini requests per minute and tokens per
+    minute, plus a per-UTC-day request count. acquire() only waits as long as
+    the windows require, so requests go out immediately while there is budget
+    left. The daily count lives in a diskcache so it survives across runs.
+    """
+    
+    def __init__(self, rpm: int, tpm: int, rpd: int, cache: diskcache.Cache):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.rpd = rpd
+        self.cache = cache
+        self.minute = deque()  # (timestamp, tokens) of requests in the last 60s
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self, tokens: int):
+        """
+        Wait until a request of the given size fits all three windows.
         
-        response = requests.post(url, json=payload, timeout=30)
-        response.raise_for_status()
+        Args:
+            tokens: Estimated input tokens of the request
+            
+        Raises:
+            RuntimeError: If the daily request budget is used up
+        """
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                while self.minute and now - self.minute[0][0] >= 60:
+                    self.minute.popleft()
+                day_key = f"gemini:rpd:{datetime.now(timezone.utc):%Y-%m-%d}"
+                
+                # Waiting for the daily window to roll over is pointless in a daily job
+                if self.cache.get(day_key, 0) >= self.rpd:
+                    raise RuntimeError(f"Gemini daily request budget ({self.rpd}) exhausted")
+                
+                wait = 0.0
+                if len(self.minute) >= self.rpm:
+                    wait = 60 - (now - self.minute[-self.rpm][0])
+                
+                excess = sum(t for _, t in self.minute) + tokens - self.tpm
+                for timestamp, used in self.minute:
+                    if excess <= 0:
+                        break
+                    excess -= used
+                    wait = max(wait, 60 - (now - timestamp))
+                
+                if wait <= 0:
+                    self.minute.append((now, tokens))
+                    # add() only seeds a missing key; incr() is atomic across processes
+                    self.cache.add(day_key, 0, expire=86400)
+                    self.cache.incr(day_key)
+                    return
+                await asyncio.sleep(wait)
+
+
+GEMINI_RATE_LIMITER = GeminiRateLimiter(GEMINI_RPM, GEMINI_TPM, GEMINI_RPD, CACHE)
+
+
+async def translate_to_korean(session: aiohttp.ClientSession, text: str, api_key: str) -> Optional[str]:
+    """
+    Translate English text to Korean using Google Gemini API.
+    
+    Args:
+        session: Shared aiohttp session
+        text: Text to translate
+        api_key: Google Gemini API key
         
-        result = response.json()
-        translation = result['candidates'][0]['content']['parts'][0]['text'].strip()
+    Returns:
+        Korean translation
+    """
+    try:
+        payload = build_gemini_request(TRANSLATION_INSTRUCTION, text)
         
-        # Add delay to avoid rate limiting
-        time.sleep(4.5)
+        async with session.post(GEMINI_GENERATE_URL, json=payload, headers={'x-goog-api-key': api_key},
+                                timeout=GEMINI_TIMEOUT) as response:
+            response.raise_for_status()
+            result = await response.json()
         
+        translation = result['candidates'][0]['content']['parts'][0]['text'].strip()
         return translation
         
     except Exception as e:
@@ -282,71 +478,247 @@ def translate_to_korean(text: str, api_key: str) -> str:
         return None
 
 
-def summarize_with_gemini(text: str, api_key: str, title: str = "") -> str:
+async def summarize_with_gemini(session: aiohttp.ClientSession, text: str, api_key: str, title: str = "") -> Optional[str]:
     """
     Summarize text using Google Gemini API via REST.
     
     Args:
+        session: Shared aiohttp session
         text: Text to summarize
         api_key: Google Gemini API key
         title: Optional title for context
         
     Returns:
-        Korean 3-line summary
+        Korean 3-line summary, or None if summarization failed
     """
     try:
         # Use REST API directly for better compatibility
-        url = f"https://generativelanguage.googleapis.com/v1/models/gemini-2.5-flash:generateContent?key={api_key}"
+        payload = build_gemini_request(SUMMARY_INSTRUCTION, text)
         
-        prompt = f"""다음은 암호화폐/크립토 산업 관련 뉴스입니다. 
-이 내용을 한국어로 정확히 3줄로 요약해주세요. 
-각 줄은 한 문장으로, 핵심 정보만 간결하게 담아주세요.
-각 줄 앞에 1️⃣ 2️⃣ 3️⃣ 이모티콘을 붙여주세요.
+        async with session.post(GEMINI_GENERATE_URL, json=payload, headers={'x-goog-api-key': api_key},
+                                timeout=GEMINI_TIMEOUT) as response:
+            response.raise_for_status()
+            result = await response.json()
+        
+        summary = result['candidates'][0]['content']['parts'][0]['text'].strip()
+        
+        # Ensure we have at most 3 lines
+        return trim_summary(summary)
+        
+    except Exception as e:
+        print(f"  ⚠️  Error summarizing with Gemini: {e}")
+        # Return None so the caller falls back to the article text
+        return None
 
-뉴스 내용:
-{text[:3000]}
 
-3줄 요약 (예시: 1️⃣ 첫번째 요약...\n2️⃣ 두번째 요약...\n3️⃣ 세번째 요약...):"""
+async def process_job(job: Dict, process_type: str, session: aiohttp.ClientSession) -> Optional[str]:
+    """
+    Run the Gemini call for one message under the rate limits.
+    
+    Args:
+        job: Collected job with the message and its source text
+        process_type: 'scrape' (summarize) or 'translate'
+        session: Shared aiohttp session
         
-        payload = {
-            "contents": [{
-                "parts": [{
-                    "text": prompt
-                }]
-            }]
+    Returns:
+        Summary/translation text, or None if the call failed
+    """
+    # Stay within the Gemini free tier limits
+    await GEMINI_RATE_LIMITER.acquire(estimate_tokens(truncate_to_tokens(job['text'])))
+    if process_type == 'scrape':
+        return await summarize_with_gemini(session, job['text'], GEMINI_API_KEY)
+    print(f"  🌐 Translating message {job['msg']['id']}...")
+    return await translate_to_korean(session, job['text'], GEMINI_API_KEY)
+
+
+def build_batch_requests(requests_by_key: Dict[str, Dict]) -> List[Dict]:
+    """
+    Build inline Gemini Batch Mode requests.
+    
+    Args:
+        requests_by_key: Mapping of request key (message id) to request body
+        
+    Returns:
+        List of batch request entries keyed by message id
+    """
+    return [
+        {
+            "request": request,
+            "metadata": {"key": key}
         }
+        for key, request in requests_by_key.items()
+    ]
+
+
+async def cancel_batch(session: aiohttp.ClientSession, batch_name: str, headers: Dict[str, str]):
+    """
+    Cancel a Gemini batch we've stopped waiting for, so it isn't billed on
+    top of the interactive fallback requests.
+    
+    Args:
+        session: Shared aiohttp session
+        batch_name: Batch resource name, e.g. 'batches/123'
+        headers: Request headers carrying the API key
+    """
+    try:
+        async with session.post(f"{GEMINI_API_BASE}/{batch_name}:cancel", headers=headers,
+                                timeout=GEMINI_TIMEOUT) as response:
+            response.raise_for_status()
+        print(f"  🛑 Cancelled Gemini batch {batch_name}")
+    except Exception as e:
+        print(f"  ⚠️  Failed to cancel Gemini batch {batch_name}: {e}")
+
+
+async def collect_batch_results(session: aiohttp.ClientSession, batch_requests: List[Dict],
+                                api_key: str) -> Dict[str, str]:
+    """
+    Submit a Gemini Batch Mode job and wait for its results.
+    
+    Batch jobs are billed at 50% of the interactive price and are not subject
+    to the per-minute rate limit, so no per-request delay is needed.
+    
+    Args:
+        session: Shared aiohttp session
+        batch_requests: Entries built by build_batch_requests()
+        api_key: Google Gemini API key
         
-        response = requests.post(url, json=payload, timeout=30)
-        response.raise_for_status()
+    Returns:
+        Mapping of request key to response text (missing keys failed)
+    """
+    if not batch_requests:
+        return {}
+    
+    headers = {'x-goog-api-key': api_key}
+    payload = {
+        "batch": {
+            "display_name": f"tg-to-slack-{int(time.time())}",
+            "input_config": {
+                "requests": {
+                    "requests": batch_requests
+                }
+            }
+        }
+    }
+    
+    batch_name = None
+    try:
+        async with session.post(GEMINI_BATCH_URL, json=payload, headers=headers, timeout=GEMINI_TIMEOUT) as response:
+            response.raise_for_status()
+            batch_name = (await response.json())['name']
+        print(f"  📦 Submitted Gemini batch {batch_name} ({len(batch_requests)} requests)")
         
-        result = response.json()
-        summary = result['candidates'][0]['content']['parts'][0]['text'].strip()
+        deadline = time.monotonic() + GEMINI_BATCH_TIMEOUT
+        while True:
+            async with session.get(f"{GEMINI_API_BASE}/{batch_name}", headers=headers,
+                                   timeout=GEMINI_TIMEOUT) as response:
+                response.raise_for_status()
+                operation = await response.json()
+            state = operation.get('metadata', {}).get('state', '')
+            
+            if operation.get('done') or state in BATCH_TERMINAL_STATES:
+                break
+            if time.monotonic() > deadline:
+                print(f"  ⚠️  Gemini batch {batch_name} still {state} after {GEMINI_BATCH_TIMEOUT}s")
+                await cancel_batch(session, batch_name, headers)
+                return {}
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+        
+        if state != 'BATCH_STATE_SUCCEEDED':
+            print(f"  ⚠️  Gemini batch {batch_name} finished with state {state}")
+            return {}
         
-        # Add delay to avoid rate limiting (Gemini free tier: 15 RPM)
-        time.sleep(4.5)  # 60s / 15 requests = 4s per request, add buffer
+        inlined = operation.get('response', {}).get('inlinedResponses', {})
+        if isinstance(inlined, dict):
+            inlined = inlined.get('inlinedResponses', [])
+        
+        results = {}
+        for item in inlined:
+            key = item.get('metadata', {}).get('key')
+            try:
+                text = item['response']['candidates'][0]['content']['parts'][0]['text'].strip()
+            except (KeyError, IndexError, TypeError):
+                continue
+            if key is not None and text:
+                results[key] = text
         
-        # Ensure we have exactly 3 lines
-        lines = [line.strip() for line in summary.split('\n') if line.strip()]
-        if len(lines) > 3:
-            summary = '\n'.join(lines[:3])
-        elif len(lines) < 3:
-            # If less than 3 lines, just use what we have
-            summary = '\n'.join(lines)
+        print(f"  ✅ Gemini batch returned {len(results)}/{len(batch_requests)} results")
+        return results
         
-        return summary
+    except asyncio.CancelledError:
+        # Don't leave the batch running (and billed) after the run is aborted
+        if batch_name:
+            await cancel_batch(session, batch_name, headers)
+        raise
         
     except Exception as e:
-        print(f"  ⚠️  Error summarizing with Gemini: {e}")
-        # Fallback: return first 200 characters
-        return text[:200] + "..." if len(text) > 200 else text
+        print(f"  ⚠️  Error running Gemini batch: {e}")
+        # Jobs fall back to interactive requests, so the batch must not also finish
+        if batch_name:
+            await cancel_batch(session, batch_name, headers)
+        return {}
 
 
-def send_to_slack(summaries: List[Dict], webhook_url: str, date: str):
+async def post_slack_chunk(session: aiohttp.ClientSession, webhook_url: str, payload: Dict,
+                           chunk_idx: int, n_chunks: int, n_summaries: int):
+    """Post one chunk of blocks to the Slack webhook and log the outcome."""
+    try:
+        async with session.post(webhook_url, data=orjson.dumps(payload), headers=SLACK_HEADERS,
+                                timeout=SLACK_TIMEOUT) as response:
+            response.raise_for_status()
+        if n_chunks > 1:
+            print(f"✅ Successfully sent chunk {chunk_idx}/{n_chunks} ({n_summaries} summaries)")
+        else:
+            print(f"✅ Successfully sent {n_summaries} summaries to Slack")
+    except Exception as e:
+        print(f"❌ Error sending chunk {chunk_idx} to Slack: {e}")
+
+
+def build_summary_blocks(idx: int, summary: Dict, is_last: bool) -> List[Dict]:
+    """
+    Build the Slack blocks for one summary.
+    
+    Args:
+        idx: 1-based position of the summary in the day's list
+        summary: Summary dictionary with summary, date and link
+        is_last: Whether this is the last summary in its chunk
+        
+    Returns:
+        Section block, optional link block, and a divider unless last
+    """
+    blocks = [{
+        "type": "section",
+        "text": {
+            "type": "mrkdwn",
+            "text": f"*{idx}. [{summary['date'].strftime('%H:%M')}] 뉴스*\n{summary['summary']}"
+        }
+    }]
+    
+    # Add link button if available
+    if summary.get('link'):
+        blocks.append({
+            "type": "section",
+            "text": {
+                "type": "mrkdwn",
+                "text": f"<{summary['link']}|📎 원문 보기>"
+            }
+        })
+    
+    # Add divider between messages (except after the last one)
+    if not is_last:
+        blocks.append(DIVIDER_BLOCK)
+    
+    return blocks
+
+
+async def send_to_slack(session: aiohttp.ClientSession, summaries: List[Dict], webhook_url: str, date: str):
     """
     Send summaries to Slack via webhook.
     Split into multiple messages if needed to avoid Slack's 50 block limit.
+    Chunks are posted concurrently over the shared session; the (i/n) header
+    suffix keeps them identifiable if they arrive out of order.
     
     Args:
+        session: Shared aiohttp session
         summaries: List of message summaries
         webhook_url: Slack webhook URL
         date: Date string for the header
@@ -367,6 +739,7 @@ def send_to_slack(summaries: List[Dict], webhook_url: str, date: str):
     chunk_size = 15
     chunks = [summaries[i:i + chunk_size] for i in range(0, len(summaries), chunk_size)]
     
+    posts = []
     for chunk_idx, chunk in enumerate(chunks, 1):
         # Build Slack message for this chunk
         blocks = [
@@ -378,37 +751,15 @@ def send_to_slack(summaries: List[Dict], webhook_url: str, date: str):
                     "emoji": True
                 }
             },
-            {
-                "type": "divider"
-            }
+            DIVIDER_BLOCK
         ]
         
         start_idx = (chunk_idx - 1) * chunk_size
-        for idx, summary in enumerate(chunk, start_idx + 1):
-            # Add message section
-            time_str = summary['date'].strftime('%H:%M')
-            
-            blocks.append({
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*{idx}. [{time_str}] 뉴스*\n{summary['summary']}"
-                }
-            })
-            
-            # Add link button if available
-            if summary.get('link'):
-                blocks.append({
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"<{summary['link']}|📎 원문 보기>"
-                    }
-                })
-            
-            # Add divider between messages (except after the last one)
-            if idx < start_idx + len(chunk):
-                blocks.append({"type": "divider"})
+        blocks += [
+            block
+            for idx, summary in enumerate(chunk, start_idx + 1)
+            for block in build_summary_blocks(idx, summary, idx == start_idx + len(chunk))
+        ]
         
         # Add footer
         if chunk_idx == len(chunks):
@@ -426,15 +777,188 @@ def send_to_slack(summaries: List[Dict], webhook_url: str, date: str):
             "blocks": blocks
         }
         
-        try:
-            response = requests.post(webhook_url, json=payload)
-            response.raise_for_status()
-            if len(chunks) > 1:
-                print(f"✅ Successfully sent chunk {chunk_idx}/{len(chunks)} ({len(chunk)} summaries)")
+        n_summaries = len(chunk) if len(chunks) > 1 else len(summaries)
+        posts.append(post_slack_chunk(session, webhook_url, payload, chunk_idx, len(chunks), n_summaries))
+    
+    await asyncio.gather(*posts)
+
+
+async def process_channel(channel_name: str, process_type: str, messages: List[Dict],
+                          http_session: aiohttp.ClientSession,
+                          scrape_session: aiohttp.ClientSession) -> List[Dict]:
+    """
+    Summarize or translate one channel's messages.
+    
+    A producer builds each message's Gemini job (awaiting its article for
+    scrape channels) and queues it; GEMINI_WORKERS consumers run the Gemini
+    calls meanwhile, so article fetching overlaps with summarization.
+    
+    Args:
+        channel_name: Channel username
+        process_type: 'scrape' (summarize linked article) or 'translate'
+        messages: Messages from fetch_yesterday_messages()
+        http_session: Shared aiohttp session for Gemini
+        scrape_session: Pooled aiohttp session for article scraping
+        
+    Returns:
+        List of summary dictionaries in message order
+    """
+    # For ahboyashreads: start fetching every linked article concurrently up front
+    fetches = {}
+    if process_type == 'scrape':
+        # Skip X.com and t.me links (require JavaScript/login)
+        message_urls = {
+            msg['id']: [
+                url for url in extract_urls(msg['text'])
+                if urlsplit(url).hostname not in BLOCKED_HOSTS
+            ]
+            for msg in messages
+        }
+        
+        async def fetch_and_cache(url: str) -> Optional[str]:
+            content = CACHE.get(f"article:{url}")
+            if content is None:
+                print(f"  🔗 Fetching content from: {url[:60]}...")
+                content = await fetch_article_content(scrape_session, url)
+                if content:
+                    CACHE.set(f"article:{url}", content, expire=CACHE_EXPIRE)
+            return content
+        
+        for urls in message_urls.values():
+            for url in urls:
+                if url not in fetches:
+                    fetches[url] = asyncio.create_task(fetch_and_cache(url))
+    
+    jobs = []
+    gemini_results = {}
+    queue = asyncio.Queue(maxsize=4)
+    
+    async def build_job(msg: Dict) -> Optional[Dict]:
+        if process_type == 'scrape':
+            # For ahboyashreads: summarize scraped article content
+            content = None
+            article_url = None
+            
+            # Use the first URL that yielded an article
+            for url in message_urls[msg['id']]:
+                content = await fetches[url]
+                
+                if content and len(content) >= 300:
+                    # Only summarize sufficient content
+                    print(f"      ✓ Fetched {len(content)} chars from {url[:60]}")
+                    article_url = url
+                    break  # Use first successful article
+                elif content:
+                    print(f"      ⚠️  Content too short ({len(content)} chars), skipping")
+                content = None
+            
+            # Skip if no article could be scraped
+            if not content:
+                print(f"  ⏭️  Skipped message {msg['id']} (no scrapeable content)")
+                return None
+            
+            job = {
+                'msg': msg,
+                'text': content,
+                'request': build_gemini_request(SUMMARY_INSTRUCTION, content),
+                'link': article_url
+            }
+        else:
+            # For shoalresearch: just translate the message
+            urls = extract_urls(msg['text'])
+            job = {
+                'msg': msg,
+                'text': msg['text'],
+                'request': build_gemini_request(TRANSLATION_INSTRUCTION, msg['text']),
+                'link': urls[0] if urls else msg['link']
+            }
+        
+        # Gemini output from earlier runs is cached by the full request
+        job['cache_key'] = 'gemini:' + hashlib.sha256(
+            json.dumps(job['request'], sort_keys=True).encode()
+        ).hexdigest()
+        return job
+    
+    async def producer():
+        deferred = []
+        for msg in messages:
+            job = await build_job(msg)
+            if job is None:
+                continue
+            jobs.append(job)
+            
+            cached = CACHE.get(job['cache_key'])
+            if cached:
+                gemini_results[str(msg['id'])] = cached
+            elif GEMINI_BATCH_MODE:
+                deferred.append(job)
             else:
-                print(f"✅ Successfully sent {len(summaries)} summaries to Slack")
-        except Exception as e:
-            print(f"❌ Error sending chunk {chunk_idx} to Slack: {e}")
+                await queue.put(job)
+        
+        if deferred:
+            print(f"  📦 Submitting {len(deferred)} prompts to Gemini Batch Mode...")
+            batch_results = await collect_batch_results(
+                http_session,
+                build_batch_requests({str(job['msg']['id']): job['request'] for job in deferred}),
+                GEMINI_API_KEY
+            )
+            for job in deferred:
+                result = batch_results.get(str(job['msg']['id']))
+                if result:
+                    gemini_results[str(job['msg']['id'])] = result
+                    CACHE.set(job['cache_key'], result, expire=CACHE_EXPIRE)
+                else:
+                    # Fall back to an interactive call
+                    await queue.put(job)
+        
+        # Let every article task finish before the sessions close
+        await asyncio.gather(*fetches.values())
+        for _ in range(GEMINI_WORKERS):
+            await queue.put(None)
+    
+    async def consumer():
+        while (job := await queue.get()) is not None:
+            # One failure must not stop the rest
+            try:
+                result = await process_job(job, process_type, http_session)
+            except Exception as e:
+                print(f"  ⚠️  Error processing message {job['msg']['id']}: {e}")
+                result = None
+            gemini_results[str(job['msg']['id'])] = result
+            if result:
+                CACHE.set(job['cache_key'], result, expire=CACHE_EXPIRE)
+    
+    await asyncio.gather(producer(), *(consumer() for _ in range(GEMINI_WORKERS)))
+    
+    summaries = []
+    for job in jobs:
+        msg = job['msg']
+        summary_text = gemini_results.get(str(msg['id']))
+        
+        if process_type == 'scrape':
+            if summary_text:
+                summary_text = trim_summary(summary_text)
+            else:
+                # Fallback: first 200 characters of the article
+                text = job['text']
+                summary_text = text[:200] + "..." if len(text) > 200 else text
+                
+        elif process_type == 'translate':
+            # Skip if translation failed
+            if not summary_text:
+                print(f"  ⏭️  Skipped message {msg['id']} (translation failed)")
+                continue
+        
+        if summary_text:
+            summaries.append({
+                'summary': summary_text,
+                'date': msg['date'],
+                'link': job['link'] or msg['link'],
+                'channel': channel_name
+            })
+            print(f"  ✓ Processed message {msg['id']}")
+    
+    return summaries
 
 
 async def main():
@@ -444,23 +968,36 @@ async def main():
     # Validate configuration
     validate_config()
     
-    # Setup session file
-    session_name = setup_session_file()
+    # Load session
+    session = load_session(TELEGRAM_SESSION_B64)
     
     # Initialize Telegram client
-    client = TelegramClient(session_name, TELEGRAM_API_ID, TELEGRAM_API_HASH)
+    client = TelegramClient(session, TELEGRAM_API_ID, TELEGRAM_API_HASH)
+    
+    # Shared HTTP session for Gemini and Slack requests
+    http_session = aiohttp.ClientSession()
+    
+    # Pooled session for article scraping (bounded per host, cached DNS)
+    scrape_session = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=32, limit_per_host=4, ttl_dns_cache=300),
+        headers=SCRAPE_HEADERS,
+        fallback_charset_resolver=sniff_charset
+    )
     
     try:
         # Connect to Telegram
         await client.start()
         print("✅ Connected to Telegram")
         
+        # Compute the date range once so every channel and the Slack header agree
+        window = yesterday_window()
+        
         # Process messages from all channels
         all_summaries = []
         
         for channel_name, process_type in TELEGRAM_CHANNELS.items():
             print(f"\n📡 Processing channel: @{channel_name}")
-            messages = await fetch_yesterday_messages(client, channel_name)
+            messages = await fetch_yesterday_messages(client, channel_name, window)
             
             if not messages:
                 print(f"  ℹ️  No messages found from {channel_name}")
@@ -468,72 +1005,21 @@ async def main():
             
             print(f"🤖 Processing {len(messages)} messages from @{channel_name}...")
             
-            for msg in messages:
-                summary_text = None
-                article_url = None
-                
-                if process_type == 'scrape':
-                    # For ahboyashreads: scrape article content
-                    urls = extract_urls(msg['text'])
-                    
-                    if urls:
-                        # Try to fetch and summarize content from each URL
-                        for url in urls:
-                            # Skip X.com and t.me links (require JavaScript/login)
-                            if 'x.com' in url or 't.me' in url or 'twitter.com' in url:
-                                continue
-                            
-                            print(f"  🔗 Fetching content from: {url[:60]}...")
-                            content = fetch_article_content(url)
-                            
-                            if content and len(content) >= 300:
-                                # Summarize the article content (only if sufficient content)
-                                print(f"      ✓ Fetched {len(content)} chars")
-                                summary_text = summarize_with_gemini(content, GEMINI_API_KEY)
-                                article_url = url
-                                break  # Use first successful article
-                            elif content:
-                                print(f"      ⚠️  Content too short ({len(content)} chars), skipping")
-                    
-                    # Skip if no article could be scraped
-                    if not summary_text:
-                        print(f"  ⏭️  Skipped message {msg['id']} (no scrapeable content)")
-                        continue
-                        
-                elif process_type == 'translate':
-                    # For shoalresearch: just translate the message
-                    print(f"  🌐 Translating message {msg['id']}...")
-                    summary_text = translate_to_korean(msg['text'], GEMINI_API_KEY)
-                    
-                    # Skip if translation failed
-                    if not summary_text:
-                        print(f"  ⏭️  Skipped message {msg['id']} (translation failed)")
-                        continue
-                    
-                    urls = extract_urls(msg['text'])
-                    article_url = urls[0] if urls else msg['link']
-                
-                if summary_text:
-                    all_summaries.append({
-                        'summary': summary_text,
-                        'date': msg['date'],
-                        'link': article_url or msg['link'],
-                        'channel': channel_name
-                    })
-                    print(f"  ✓ Processed message {msg['id']}")
+            all_summaries += await process_channel(
+                channel_name, process_type, messages, http_session, scrape_session
+            )
         
         summaries = all_summaries
         
         # Send to Slack
-        kst = pytz.timezone('Asia/Seoul')
-        yesterday = (datetime.now(kst) - timedelta(days=1)).strftime('%Y년 %m월 %d일')
+        yesterday = window[2]
         
         if summaries:
             print(f"\n📤 Sending {len(summaries)} summaries to Slack...")
-            send_to_slack(summaries, SLACK_WEBHOOK_URL, yesterday)
+            await send_to_slack(http_session, summaries, SLACK_WEBHOOK_URL, yesterday)
         else:
             print("ℹ️  No summaries to send to Slack")
-            send_to_slack([], SLACK_WEBHOOK_URL, yesterday)
+            await send_to_slack(http_session, [], SLACK_WEBHOOK_URL, yesterday)
         
         print("✅ All done!")
         
@@ -541,14 +1027,14 @@ async def main():
         print(f"❌ Unexpected error: {e}")
         raise
     finally:
+        await http_session.close()
+        await scrape_session.close()
+        CACHE.close()
         await client.disconnect()
         print("👋 Disconnected from Telegram")
 
 
 if __name__ == '__main__':
-    import asyncio
-    import sys
-    
     # Support channel filtering from command line
     if len(sys.argv) > 1:
         channel_filter = sys.argv[1]
@@ -560,4 +1046,9 @@ if __name__ == '__main__':
             print(f"Available channels: {', '.join(TELEGRAM_CHANNELS.keys())}")
             sys.exit(1)
     
-    asyncio.run(main())
+    # Prefer the libuv-based event loop when available
+    if uvloop is not None:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(main())
+    else:
+        asyncio.run(main())
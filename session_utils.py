@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Shared Telegram helpers for main.py, test_fetch.py and setup_session.py.
+Loads the TELEGRAM_SESSION secret, reuses one connected client per
+process and caches resolved channel entities on disk so runs can skip
+username resolution.
+"""
+
+import base64
+import json
+import asyncio
+import sqlite3
+import threading
+from typing import Dict, List, Optional
+from telethon import TelegramClient
+from telethon.crypto import AuthKey
+from telethon.sessions import StringSession
+from telethon.tl.types import InputPeerChannel
+
+# Client shared by every get_client() call in this process
+_client: Optional[TelegramClient] = None
+
+# Resolved channel ids/access hashes, so later runs can skip username resolution
+ENTITY_CACHE_FILE = '.entity_cache.json'
+# Serializes read-modify-write of the cache file across worker threads
+_cache_lock = threading.Lock()
+
+
+def load_session(value: Optional[str]):
+    """
+    Load the Telegram session from a TELEGRAM_SESSION value into memory,
+    without writing a session file.
+    
+    Accepts either a StringSession string or the base64-encoded SQLite
+    session file produced by older versions of setup_session.py.
+    
+    Args:
+        value: TELEGRAM_SESSION environment variable value
+        
+    Returns:
+        StringSession, or the local 'tg_session' file name as a fallback
+    """
+    if not value:
+        print("ℹ️  No session environment variable found, using local session file")
+        return 'tg_session'
+    
+    try:
+        if value.startswith('1'):
+            session = StringSession(value)
+        else:
+            # Legacy base64 SQLite file: read the auth key from an in-memory copy
+            db = sqlite3.connect(':memory:')
+            db.deserialize(base64.b64decode(value))
+            dc_id, server_address, port, auth_key = db.execute(
+                'SELECT dc_id, server_address, port, auth_key FROM sessions'
+            ).fetchone()
+            db.close()
+            
+            session = StringSession()
+            session.set_dc(dc_id, server_address, port)
+            session.auth_key = AuthKey(auth_key)
+        
+        print("✅ Telegram session loaded from environment variable")
+        return session
+    except Exception as e:
+        print(f"⚠️  Failed to decode session from environment: {e}")
+        print("   Re-run setup_session.py and update TELEGRAM_SESSION")
+        return 'tg_session'
+
+
+async def get_client(session, api_id, api_hash) -> TelegramClient:
+    """
+    Return a connected, authorized Telegram client, reusing the one already
+    created in this process so the MTProto handshake is only paid once.
+    
+    Args:
+        session: Session name or Session object
+        api_id: Telegram API ID
+        api_hash: Telegram API hash
+        
+    Returns:
+        Connected TelegramClient
+    """
+    global _client
+    if _client is None:
+        _client = TelegramClient(session, api_id, api_hash)
+    
+    if not _client.is_connected():
+        await _client.connect()
+    
+    # Only run the interactive login when the session isn't authorized yet
+    if not await _client.is_user_authorized():
+        await _client.start()
+    return _client
+
+
+def load_entity_cache() -> Dict[str, List[int]]:
+    """Load cached channel entities ({channel: [id, access_hash]}) from disk."""
+    try:
+        with open(ENTITY_CACHE_FILE, 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_entity_cache(cache: Dict[str, List[int]]):
+    """Write cached channel entities to disk."""
+    try:
+        with open(ENTITY_CACHE_FILE, 'w') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"⚠️  Failed to write entity cache: {e}")
+
+
+def update_entity_cache(channel: str, entry: Optional[List[int]]):
+    """
+    Set one channel's cached entity on disk, or drop it when entry is None.
+    
+    Args:
+        channel: Channel username
+        entry: [id, access_hash], or None to remove the channel
+    """
+    with _cache_lock:
+        cache = load_entity_cache()
+        if entry is None:
+            if cache.pop(channel, None) is None:
+                return
+        else:
+            cache[channel] = entry
+        save_entity_cache(cache)
+
+
+async def resolve_channel(client: TelegramClient, channel: str):
+    """
+    Resolve a channel username, using the on-disk entity cache when possible.
+    
+    Args:
+        client: Authenticated Telegram client
+        channel: Channel username
+        
+    Returns:
+        InputPeerChannel from the cache, or the freshly resolved entity
+    """
+    # Cache file I/O runs in a worker thread so it never blocks the event loop
+    cache = await asyncio.to_thread(load_entity_cache)
+    if channel in cache:
+        channel_id, access_hash = cache[channel]
+        return InputPeerChannel(channel_id, access_hash)
+    
+    entity = await client.get_entity(channel)
+    await asyncio.to_thread(update_entity_cache, channel, [entity.id, entity.access_hash])
+    return entity
+
+
+async def forget_channel(channel: str):
+    """Drop a channel from the entity cache, e.g. after its access hash was rejected."""
+    await asyncio.to_thread(update_entity_cache, channel, None)
@@ -1,48 +1,56 @@
 #!/usr/bin/env python3
 """
-Helper script to create Telegram session file.
-Run this locally to authenticate and generate the session file.
+Helper script to create a Telegram session string.
+Run this locally to authenticate and print the StringSession for TELEGRAM_SESSION.
 """
 
 import os
-import base64
-from telethon import TelegramClient
+import sys
+import asyncio
+from telethon.sessions import StringSession
 from dotenv import load_dotenv
+from session_utils import get_client
 
-load_dotenv()
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
 
-API_ID = os.getenv('TELEGRAM_API_ID')
-API_HASH = os.getenv('TELEGRAM_API_HASH')
+load_dotenv()
 
-if not API_ID or not API_HASH:
-    print("❌ Please set TELEGRAM_API_ID and TELEGRAM_API_HASH in .env file")
+try:
+    # Cast once here instead of passing a string on to Telethon
+    API_ID = int(os.environ['TELEGRAM_API_ID'])
+    API_HASH = os.environ['TELEGRAM_API_HASH']
+except (KeyError, ValueError):
+    print("❌ Please set TELEGRAM_API_ID (numeric) and TELEGRAM_API_HASH in .env file")
     exit(1)
 
+BANNER = "=" * 60
+
 async def create_session():
-    """Create Telegram session file."""
-    client = TelegramClient('tg_session', API_ID, API_HASH)
-    
+    """Create a Telegram session and print it as a StringSession."""
     print("🔐 Starting Telegram authentication...")
     print("You will receive a code on your Telegram app.")
     
-    await client.start()
+    # In-memory session: no sqlite file to open, journal and encode
+    client = await get_client(StringSession(), API_ID, API_HASH)
     
     print("✅ Successfully authenticated!")
-    print("📁 Session file created: tg_session.session")
-    
-    # Read session file and encode to base64
-    with open('tg_session.session', 'rb') as f:
-        session_data = f.read()
-        session_b64 = base64.b64encode(session_data).decode('utf-8')
     
-    print("\n" + "="*60)
-    print("📋 Add this to your GitHub Secrets as TELEGRAM_SESSION:")
-    print("="*60)
-    print(session_b64)
-    print("="*60)
+    # One write so Telethon log output can't interleave with the secret
+    sys.stdout.write(
+        f"\n{BANNER}\n📋 Add this to your GitHub Secrets as TELEGRAM_SESSION:\n"
+        f"{BANNER}\n{client.session.save()}\n{BANNER}\n"
+    )
+    sys.stdout.flush()
     
     await client.disconnect()
 
 if __name__ == '__main__':
-    import asyncio
-    asyncio.run(create_session())
+    # Prefer the libuv-based event loop when available
+    if uvloop is not None:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(create_session())
+    else:
+        asyncio.run(create_session())
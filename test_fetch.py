@@ -4,47 +4,128 @@ Test script to fetch recent messages from the channel
 """
 
 import os
-from datetime import datetime, timedelta
-import pytz
+import sys
+import asyncio
+from collections import namedtuple
+from datetime import datetime
+from zoneinfo import ZoneInfo
 from telethon import TelegramClient
+from telethon.errors import ChannelPrivateError, ChannelInvalidError
+from telethon.tl.functions.messages import GetHistoryRequest
+from telethon.tl.types import InputPeerChannel, Message
 from dotenv import load_dotenv
+from session_utils import get_client, load_session, resolve_channel, forget_channel
+
+try:
+    import uvloop
+except ImportError:  # uvloop is unavailable on Windows
+    uvloop = None
 
 load_dotenv()
 
-TELEGRAM_API_ID = os.getenv('TELEGRAM_API_ID')
-TELEGRAM_API_HASH = os.getenv('TELEGRAM_API_HASH')
+# Required: fail at startup on a missing or non-numeric API ID
+TELEGRAM_API_ID = int(os.environ['TELEGRAM_API_ID'])
+TELEGRAM_API_HASH = os.environ['TELEGRAM_API_HASH']
+TELEGRAM_SESSION = os.getenv('TELEGRAM_SESSION')
 TELEGRAM_CHANNEL = os.getenv('TELEGRAM_CHANNEL', 'ahboyashreads')
+# Comma-separated list; falls back to the single TELEGRAM_CHANNEL
+TELEGRAM_CHANNELS = [
+    c.strip() for c in os.getenv('TELEGRAM_CHANNELS', TELEGRAM_CHANNEL).split(',') if c.strip()
+]
+KST = ZoneInfo('Asia/Seoul')
+PREVIEW_CHARS = 100
+RECENT_LIMIT = 10
+# Over-fetch so service/media-only messages don't leave the listing short
+HISTORY_LIMIT = 20
+# One entry per message in the output listing
+MESSAGE_TEMPLATE = '[{0}] Message {1}\n   {2}\n'
+
+# Tuple-backed record: no per-message dict
+Msg = namedtuple('Msg', 'id date text')
+
+def fmt(d: datetime) -> str:
+    """Format a datetime as YYYY-MM-DD HH:MM without strftime's format parser"""
+    return f"{d.year:04d}-{d.month:02d}-{d.day:02d} {d.hour:02d}:{d.minute:02d}"
+
+async def fetch_recent(client: TelegramClient, entity):
+    """Fetch the last RECENT_LIMIT text messages from a channel entity"""
+    # One raw getHistory call instead of driving the iter_messages iterator
+    history = await client(GetHistoryRequest(
+        peer=entity, offset_id=0, offset_date=None, add_offset=0,
+        limit=HISTORY_LIMIT, max_id=0, min_id=0, hash=0
+    ))
+    
+    messages = []
+    for message in history.messages:
+        # Drop service/empty messages on their type before touching any fields
+        if not isinstance(message, Message):
+            continue
+        raw = message.message
+        if not raw:
+            continue
+        
+        # Telethon dates are already aware UTC
+        msg_date = message.date.astimezone(KST)
+        # Slicing copies at most PREVIEW_CHARS characters, however long the message
+        text = raw if len(raw) <= PREVIEW_CHARS else raw[:PREVIEW_CHARS] + '...'
+        messages.append(Msg(message.id, msg_date, text))
+        if len(messages) >= RECENT_LIMIT:
+            break
+    return messages
+
+async def collect(client: TelegramClient, channel: str):
+    """
+    Resolve a channel and fetch its recent messages
+    
+    Args:
+        client: Authenticated Telegram client
+        channel: Channel username
+        
+    Returns:
+        List of Msg records
+    """
+    # Cached entity skips the username lookup on later runs
+    entity = await resolve_channel(client, channel)
+    print(f"✅ Found channel: {channel}")
+    
+    try:
+        return await fetch_recent(client, entity)
+    except (ChannelPrivateError, ChannelInvalidError):
+        if not isinstance(entity, InputPeerChannel):
+            raise
+        # Cached access hash is no longer valid; resolve the username again
+        await forget_channel(channel)
+        entity = await resolve_channel(client, channel)
+        return await fetch_recent(client, entity)
 
 async def test_fetch():
     """Fetch recent messages for testing"""
-    client = TelegramClient('tg_session', TELEGRAM_API_ID, TELEGRAM_API_HASH)
-    
-    await client.start()
+    # Same session handling as main.py, including legacy base64 SQLite secrets
+    client = await get_client(load_session(TELEGRAM_SESSION), TELEGRAM_API_ID, TELEGRAM_API_HASH)
     print(f"✅ Connected to Telegram")
     
     try:
-        entity = await client.get_entity(TELEGRAM_CHANNEL)
-        print(f"✅ Found channel: {TELEGRAM_CHANNEL}")
-        
-        # Fetch last 10 messages
-        messages = []
-        async for message in client.iter_messages(entity, limit=10):
-            if message.message:
-                kst = pytz.timezone('Asia/Seoul')
-                msg_date = message.date.replace(tzinfo=pytz.UTC).astimezone(kst)
-                messages.append({
-                    'id': message.id,
-                    'date': msg_date,
-                    'text': message.message[:100] + '...' if len(message.message) > 100 else message.message
-                })
-        
-        print(f"\n📨 Found {len(messages)} recent messages:\n")
-        for msg in messages:
-            print(f"[{msg['date'].strftime('%Y-%m-%d %H:%M')}] Message {msg['id']}")
-            print(f"   {msg['text']}\n")
+        # Overlap the lookups and fetches of every channel
+        results = await asyncio.gather(
+            *(collect(client, channel) for channel in TELEGRAM_CHANNELS),
+            return_exceptions=True
+        )
         
-        if not messages:
-            print("⚠️  No messages found in this channel")
+        # Format everything up front and emit it with one write
+        lines = []
+        for channel, messages in zip(TELEGRAM_CHANNELS, results):
+            if isinstance(messages, Exception):
+                lines.append(f"\n❌ Error in {channel}: {messages}")
+                continue
+            
+            lines.append(f"\n📨 Found {len(messages)} recent messages in {channel}:\n")
+            for msg in messages:
+                lines.append(MESSAGE_TEMPLATE.format(fmt(msg.date), msg.id, msg.text))
+            
+            if not messages:
+                lines.append("⚠️  No messages found in this channel")
+        sys.stdout.write('\n'.join(lines) + '\n')
+        sys.stdout.flush()
         
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -52,5 +133,9 @@ async def test_fetch():
         await client.disconnect()
 
 if __name__ == '__main__':
-    import asyncio
-    asyncio.run(test_fetch())
+    # Prefer the libuv-based event loop when available
+    if uvloop is not None:
+        with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+            runner.run(test_fetch())
+    else:
+        asyncio.run(test_fetch())